@@ -7,7 +7,8 @@ Why this exists:
 - Typer provides easy-to-use CLI parsing and automatic help generation.
 
 Usage example:
-    python3 src/main.py fetch --region US --limit 5 --json --csv
+    python3 src/main.py fetch --region US --limit 5 --json --pretty --csv
+    python3 src/main.py fetch --region US,IN,CA --limit 5 --csv
 
 Industry note:
 At FAANG scale, CLI tools like this are used to kick off ETL jobs, test data sources,
@@ -15,8 +16,7 @@ and debug production pipelines.
 """
 
 import typer
-from src.utils import load_api_key, save_to_json, save_to_csv
-from src.fetch import fetch_trending_videos
+from src.utils import load_api_key, save_to_json, save_to_ndjson, save_to_csv
 
 # Create a Typer application object — handles CLI command parsing
 app = typer.Typer()
@@ -24,7 +24,7 @@ app = typer.Typer()
 @app.command(help="Fetch and optionally save trending YouTube videos")
 def fetch(
     region: str = typer.Option(
-        "US", help="Region code (ISO 3166-1 alpha-2), e.g., US, IN, CA"
+        "US", help="Region code(s) (ISO 3166-1 alpha-2), comma-separated, e.g., US or US,IN,CA"
     ),
     limit: int = typer.Option(
         5, help="Number of trending videos to fetch (1-50)"
@@ -32,38 +32,72 @@ def fetch(
     to_json: bool = typer.Option(
         False, "--json", help="Save output to a JSON file"
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Indent the JSON file for human reading"
+    ),
+    to_ndjson: bool = typer.Option(
+        False, "--ndjson", help="Save output to a newline-delimited JSON file (one video per line)"
+    ),
     to_csv: bool = typer.Option(
         False, "--csv", help="Save output to a CSV file"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached responses and call the API"
     )
 ):
     """
     CLI command to:
     1) Load API key from .env
-    2) Fetch trending videos
+    2) Fetch trending videos (concurrently when several regions are given)
     3) Print confirmation
-    4) Save to file formats if requested
+    4) Save to file formats if requested, one file per region
     """
 
+    # Deferred import: httpx/asyncio are only needed once we actually fetch,
+    # so `--help` and argument errors return without loading them.
+    import asyncio
+
+    from src.fetch import clear_cache, fetch_trending_videos, fetch_trending_videos_async
+
     # Step 1: Load API key (securely, from environment)
     api_key = load_api_key()
 
-    # Step 2: Fetch data from YouTube API
-    data = fetch_trending_videos(api_key, region=region, max_results=limit)
+    # Step 2: Fetch data from YouTube API (cached responses are reused unless --no-cache)
+    if no_cache:
+        clear_cache()
+    # The JSON/NDJSON files are the audit copy of the raw response, so they get every field;
+    # otherwise the API's default partial-response mask (title + views) suffices.
+    fetch_kwargs = {"fields": None} if to_json or to_ndjson else {}
+    regions = [r.strip() for r in region.split(",") if r.strip()]
+    if len(regions) == 1:
+        data = fetch_trending_videos(api_key, region=regions[0], max_results=limit, **fetch_kwargs)
+        results = {regions[0]: data}
+    else:
+        results = asyncio.run(
+            fetch_trending_videos_async(api_key, regions, max_results=limit, **fetch_kwargs)
+        )
+
+    for region_code, data in results.items():
+        # Step 3: Feedback to user
+        typer.echo(f"\n✅ Fetched top {limit} trending videos in {region_code}\n")
 
-    # Step 3: Feedback to user
-    typer.echo(f"\n✅ Fetched top {limit} trending videos in {region}\n")
+        # Step 4: Save to JSON if requested
+        if to_json:
+            filename = f"trending_{region_code}.json"
+            save_to_json(data, filepath=filename, pretty=pretty)
+            typer.echo(f"💾 Saved JSON to {filename}")
 
-    # Step 4: Save to JSON if requested
-    if to_json:
-        filename = f"trending_{region}.json"
-        save_to_json(data, filepath=filename)
-        typer.echo(f"💾 Saved JSON to {filename}")
+        # Step 5: Save to NDJSON if requested
+        if to_ndjson:
+            filename = f"trending_{region_code}.ndjson"
+            save_to_ndjson(data, filepath=filename)
+            typer.echo(f"💾 Saved NDJSON to {filename}")
 
-    # Step 5: Save to CSV if requested
-    if to_csv:
-        filename = f"trending_{region}.csv"
-        save_to_csv(data, filepath=filename)
-        typer.echo(f"💾 Saved CSV to {filename}")
+        # Step 6: Save to CSV if requested
+        if to_csv:
+            filename = f"trending_{region_code}.csv"
+            save_to_csv(data, filepath=filename)
+            typer.echo(f"💾 Saved CSV to {filename}")
 
 # The app() call here turns the Typer object into a runnable CLI tool.
 if __name__ == "__main__":
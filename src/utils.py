@@ -5,15 +5,27 @@ Utilities used across the project: loading secrets and saving data.
 Design goals:
 - Keep "environment concerns" (like reading .env) isolated from business logic.
 - Provide small, single-purpose functions that are easy to test.
-- Avoid side effects (e.g., no printing inside helpers unless necessary).
+- Avoid side effects (e.g., no printing inside helpers unless necessary). Helpers report
+  through the `logging` module instead, which is silent unless the caller configures it.
 """
 
+import csv
+import logging
 import os
-from typing import Optional
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
 import json
-import pandas as pd
 
+try:
+    # orjson is a compiled serializer, several times faster than the stdlib json.
+    # It's optional: without it we fall back to json and produce the same file.
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
 def load_api_key(env_path: Optional[str] = None) -> str:
     """
     Load the YouTube API key securely from a .env file (or the current env).
@@ -28,12 +40,20 @@ def load_api_key(env_path: Optional[str] = None) -> str:
     2) Reads the 'YOUTUBE_API_KEY' environment variable.
     3) Fails fast with a clear error if the key is missing (so you don't get deep mysterious failures later).
 
+    Caching:
+    - The result is memoised (lru_cache), so batch loops don't re-read .env from disk on every call.
+      Failures are not cached. Call `load_api_key.cache_clear()` after changing the environment.
+
     Returns:
         str: The API key string.
 
     Raises:
         ValueError: If the key is missing. Fail-fast is a standard engineering practice.
     """
+    # Imported here, not at module top: only this function needs it, and CLI
+    # startup (e.g. `--help`) shouldn't pay for it.
+    from dotenv import load_dotenv
+
     load_dotenv(dotenv_path=env_path)
     api_key = os.getenv("YOUTUBE_API_KEY")
     if not api_key:
@@ -42,27 +62,82 @@ def load_api_key(env_path: Optional[str] = None) -> str:
     return api_key
 
 
-def save_to_json(data: dict, filepath: str) -> None:
+def save_to_json(data: dict, filepath: str, pretty: bool = False) -> None:
     """
     Persist the raw API response to a JSON file.
 
     Why JSON?
     - JSON is a faithful representation of the API response and good for auditing/debugging.
-    - It's human-readable (with indent) and easy to diff in PRs.
+    - Compact by default: indentation roughly doubles the bytes we allocate and write.
+      Pass pretty=True when a human will read or diff the file.
 
     Args:
         data: The parsed API response (a Python dict).
         filepath: Where to write the file, e.g., 'trending_US.json'.
+        pretty: Indent the output by two spaces.
     """
     # 'with' ensures the file is properly closed even if an exception occurs.
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson returns UTF-8 bytes, so the whole document goes out in one write.
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+
+    logger.info("Saved JSON to %s", filepath)
+
+
+def save_to_ndjson(data: dict, filepath: str) -> None:
+    """
+    Write each video in the response as one JSON object per line (NDJSON).
 
+    Why NDJSON?
+    - Each item is serialized and written on its own, so peak memory is one item,
+      not the whole document — useful for large paginated pulls.
+    - Line-oriented files stream straight into tools like `jq`, BigQuery or Spark.
 
-def save_to_csv(data: dict, filepath: str) -> None:
+    Args:
+        data: The parsed API response (a Python dict).
+        filepath: Where to write the file, e.g., 'trending_US.ndjson'.
+    """
+    with open(filepath, "wb") as f:
+        for item in data.get("items", []):
+            if orjson is not None:
+                f.write(orjson.dumps(item))
+            else:
+                f.write(json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+            f.write(b"\n")
+
+    logger.info("Saved NDJSON to %s", filepath)
+
+
+def _extract_rows(items: Iterable[dict]) -> Iterator[tuple]:
+    """
+    Yield one (title, views) tuple per video.
+
+    This is the per-row hot loop of save_to_csv, so it stays lean: a generator (no
+    intermediate list), plain tuples instead of one dict per row, and `or {}` so an
+    explicit null in the payload is handled like a missing key.
+    """
+    for item in items:
+        snippet = item.get("snippet") or {}
+        stats = item.get("statistics") or {}
+        yield snippet.get("title"), stats.get("viewCount")
+
+
+def save_to_csv(data: Union[dict, Iterable[dict]], filepath: str) -> None:
     """
     Convert a subset of the API response into a flat table and write CSV.
 
+    `data` is either the parsed API response (a dict with "items") or any iterable of
+    video items — e.g. the generator from fetch.iter_trending_videos, which is then
+    written row by row without ever holding the full list in memory.
+
     Why CSV?
     - CSV is a common interchange format for analytics tools and spreadsheets.
     - A flat table is easy to inspect and test.
@@ -73,17 +148,17 @@ def save_to_csv(data: dict, filepath: str) -> None:
 
     Note:
     - We guard with .get() to avoid KeyErrors if the API shape changes or fields are missing.
+    - The stdlib csv module is plenty for a two-column table; pulling in pandas just to
+      write a few dozen rows cost far more (import time, memory) than the write itself.
     """
-    items = data.get("items", [])
-    records = []
-    for item in items:
-        snippet = item.get("snippet", {})
-        stats = item.get("statistics", {})
-        title = snippet.get("title", None)
-        views = stats.get("viewCount", None)
-        records.append({"title": title, "views": views})
-
-    df = pd.DataFrame(records)
-    df.to_csv(filepath, index=False)
+    # newline="" lets the csv module control line endings (no blank rows on Windows).
+    with open(filepath, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("title", "views"))
+        # Rows stream straight from the extractor into the writer.
+        items = data.get("items", []) if isinstance(data, dict) else data
+        writer.writerows(_extract_rows(items))
+
+    logger.info("Saved CSV to %s", filepath)
 
 
@@ -0,0 +1,30 @@
+# tests/conftest.py
+"""
+Shared pytest fixtures.
+
+Why this exists:
+- `fetch_trending_videos` caches responses on disk. Tests must never read a
+  real user's cache (stale data, false passes) or leave files behind, so every
+  test gets its own empty cache directory under pytest's tmp_path, and its
+  own empty in-memory cache.
+- `load_api_key` is memoised; clearing it keeps one test's key out of the next.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from src.utils import load_api_key
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.fetch._CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr("src.fetch._MEM", OrderedDict())
+
+
+@pytest.fixture(autouse=True)
+def fresh_api_key_cache():
+    load_api_key.cache_clear()
+    yield
+    load_api_key.cache_clear()
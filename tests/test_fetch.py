@@ -10,15 +10,16 @@ Core testing strategy:
   - slow
   - flaky due to network or quota limits
   - potentially expensive if billed).
-- Instead, we use pytest's `monkeypatch` fixture to replace `requests.get`
-  with a deterministic in-memory dummy function.
+- Instead, we use pytest's `monkeypatch` fixture to replace the shared
+  client's `get` (`src.fetch._CLIENT.get`) with a deterministic in-memory
+  dummy function.
 
 Why monkeypatch here?
 ---------------------
 - Monkeypatch lets us *temporarily* override functions or attributes at runtime
   **only for the duration of the test**.
 - This avoids adding test-only code to production logic.
-- By patching at the module path where it's used (`src.fetch.requests.get`),
+- By patching at the module path where it's used (`src.fetch._CLIENT.get`),
   we ensure the function under test sees *our* replacement, not the real network.
 
 Expected behavior under test:
@@ -30,37 +31,51 @@ Expected behavior under test:
 This style of test is called a **unit test with a stubbed dependency**.
 """
 
+import asyncio
+import json
+
 import pytest
-from src.fetch import fetch_trending_videos
+from src.fetch import (
+    fetch_many,
+    fetch_trending_videos,
+    fetch_trending_videos_async,
+    iter_trending_videos,
+)
 
 class DummyResponse:
     """
-    A minimal stand-in for `requests.Response`.
+    A minimal stand-in for `httpx.Response`.
 
     Why this exists:
-    - `fetch_trending_videos` calls `.status_code` and `.json()` on the response.
+    - `fetch_trending_videos` calls `.status_code` and `.content` (or `.json()`
+      when orjson isn't installed) on the response.
     - Instead of importing the actual `Response` object, we fake just enough
       behavior to satisfy our test.
-    - This keeps the test lightweight and decoupled from the actual `requests` internals.
+    - This keeps the test lightweight and decoupled from the actual `httpx` internals.
     """
-    status_code = 200
-
-    def __init__(self, data):
+    def __init__(self, data, status_code=200, headers=None):
         # Store the data we want `.json()` to return
         self._data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        # Simulate `httpx.Response.content`: the raw JSON body as bytes
+        return json.dumps(self._data).encode("utf-8")
 
     def json(self):
-        # Simulate `requests.Response.json()` by returning preloaded data
+        # Simulate `httpx.Response.json()` by returning preloaded data
         return self._data
 
 
 def dummy_request(*args, **kwargs):
     """
-    Replacement for `requests.get` during the test.
+    Replacement for `_CLIENT.get` during the test.
 
     Why `*args, **kwargs`?
-    - The real `requests.get` is called with positional and keyword args
-      (URL, params, timeout, etc.).
+    - The real `_CLIENT.get` is called with positional and keyword args
+      (URL, params, headers, etc.).
     - By accepting arbitrary args, our dummy won't break if the call signature
       changes in production code.
 
@@ -80,22 +95,22 @@ def dummy_request(*args, **kwargs):
 def test_fetch_trending(monkeypatch):
     """
     GIVEN:
-        - `fetch_trending_videos` depends on `requests.get` to call the YouTube API.
+        - `fetch_trending_videos` depends on `_CLIENT.get` to call the YouTube API.
         - We don't want real HTTP calls in unit tests.
     WHEN:
-        - We monkeypatch `src.fetch.requests.get` to our `dummy_request`.
+        - We monkeypatch `src.fetch._CLIENT.get` to our `dummy_request`.
         - We call `fetch_trending_videos` with a dummy API key and parameters.
     THEN:
         - The returned dict contains the `items` key.
         - The first item's title matches our dummy payload ("Test Vid").
 
     Why this matters:
-    - Verifies correct integration between our code and the `requests` API contract.
+    - Verifies correct integration between our code and the `httpx` API contract.
     - Ensures our JSON parsing logic works with the expected YouTube API schema.
     - Prevents false positives/negatives caused by network flakiness or live API changes.
     """
-    # Replace `requests.get` in the *module under test* with our dummy
-    monkeypatch.setattr("src.fetch.requests.get", dummy_request)
+    # Replace the shared client's `get` in the *module under test* with our dummy
+    monkeypatch.setattr("src.fetch._CLIENT.get", dummy_request)
 
     # Call the function with dummy values; they don't matter since dummy_request ignores them
     data = fetch_trending_videos("dummy_key", region="US", max_results=1)
@@ -103,3 +118,214 @@ def test_fetch_trending(monkeypatch):
     # Assertions check *structure* and *specific known value*
     assert "items" in data
     assert data["items"][0]["snippet"]["title"] == "Test Vid"
+
+
+def test_fetch_trending_async_multiple_regions(monkeypatch):
+    """
+    GIVEN:
+        - `fetch_trending_videos_async` issues one `httpx.AsyncClient.get` per region.
+    WHEN:
+        - We monkeypatch `AsyncClient.get` with a coroutine that echoes the region.
+        - We request two regions concurrently.
+    THEN:
+        - The result is keyed by region, and each payload belongs to its region.
+    """
+    async def dummy_async_get(self, url, params=None, **kwargs):
+        return DummyResponse({
+            "items": [{"snippet": {"title": f"Vid {params['regionCode']}"}}]
+        })
+
+    monkeypatch.setattr("src.fetch.httpx.AsyncClient.get", dummy_async_get)
+
+    results = asyncio.run(fetch_trending_videos_async("dummy_key", ["US", "IN"], max_results=1))
+
+    assert list(results) == ["US", "IN"]
+    assert results["IN"]["items"][0]["snippet"]["title"] == "Vid IN"
+
+
+def test_fetch_trending_served_from_cache(monkeypatch):
+    """
+    GIVEN:
+        - A first call that populates the on-disk cache.
+    WHEN:
+        - The same (region, max_results) is requested again within the TTL.
+    THEN:
+        - The API is called exactly once; the second result comes from disk.
+    """
+    calls = []
+
+    def counting_request(*args, **kwargs):
+        calls.append(kwargs.get("params"))
+        return dummy_request(*args, **kwargs)
+
+    monkeypatch.setattr("src.fetch._CLIENT.get", counting_request)
+
+    first = fetch_trending_videos("dummy_key", region="US", max_results=1)
+    second = fetch_trending_videos("dummy_key", region="US", max_results=1)
+
+    assert len(calls) == 1
+    assert second == first
+
+
+def test_fetch_trending_served_from_memory_before_disk(monkeypatch):
+    """
+    GIVEN:
+        - A first call that populates both the in-memory and on-disk caches.
+    WHEN:
+        - The disk cache is made unreadable and we fetch again.
+    THEN:
+        - The second call is answered from memory: no network, no disk read.
+    """
+    monkeypatch.setattr("src.fetch._CLIENT.get", dummy_request)
+    first = fetch_trending_videos("dummy_key", region="US", max_results=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("expected an in-memory cache hit")
+
+    monkeypatch.setattr("src.fetch._CLIENT.get", fail)
+    monkeypatch.setattr("src.fetch._read_cache", fail)
+
+    assert fetch_trending_videos("dummy_key", region="US", max_results=1) is first
+
+
+def test_fetch_trending_revalidates_with_etag(monkeypatch):
+    """
+    GIVEN:
+        - A cached response that carried an ETag, but is past its TTL.
+    WHEN:
+        - We fetch again and the API answers `304 Not Modified`.
+    THEN:
+        - The request sent `If-None-Match` with the stored ETag.
+        - The cached body is returned unchanged.
+    """
+    monkeypatch.setattr("src.fetch._CACHE_TTL_SECONDS", 0)
+    sent_headers = []
+
+    def etag_request(*args, headers=None, **kwargs):
+        sent_headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return DummyResponse(None, status_code=304)
+        return DummyResponse(dummy_request().json(), headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr("src.fetch._CLIENT.get", etag_request)
+
+    first = fetch_trending_videos("dummy_key", region="US", max_results=1)
+    second = fetch_trending_videos("dummy_key", region="US", max_results=1)
+
+    assert sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert second == first
+
+
+def test_fetch_trending_retries_transient_errors(monkeypatch):
+    """
+    GIVEN:
+        - The API first answers 429 (with Retry-After: 2), then 503, then 200.
+    WHEN:
+        - We fetch once.
+    THEN:
+        - The call succeeds after two retries.
+        - The waits honour Retry-After, then fall back to exponential backoff.
+    """
+    responses = [
+        DummyResponse(None, status_code=429, headers={"Retry-After": "2"}),
+        DummyResponse(None, status_code=503),
+        dummy_request(),
+    ]
+    sleeps = []
+    monkeypatch.setattr("src.fetch._CLIENT.get", lambda *args, **kwargs: responses.pop(0))
+    monkeypatch.setattr("src.fetch.time.sleep", sleeps.append)
+
+    data = fetch_trending_videos("dummy_key", region="US", max_results=1)
+
+    assert data["items"][0]["snippet"]["title"] == "Test Vid"
+    assert sleeps == [2.0, 1.0]
+
+
+def test_fetch_trending_requests_field_mask(monkeypatch):
+    """
+    GIVEN:
+        - The pipeline only reads titles and view counts.
+    WHEN:
+        - We fetch with the default arguments, then with fields=None.
+    THEN:
+        - The default call sends a `fields` mask to prune the response server-side.
+        - fields=None omits the mask (full response), and is cached separately.
+    """
+    sent_params = []
+
+    def recording_request(*args, params=None, **kwargs):
+        sent_params.append(params)
+        return dummy_request()
+
+    monkeypatch.setattr("src.fetch._CLIENT.get", recording_request)
+
+    fetch_trending_videos("dummy_key", region="US", max_results=1)
+    fetch_trending_videos("dummy_key", region="US", max_results=1, fields=None)
+
+    assert sent_params[0]["fields"] == "items(snippet/title,statistics/viewCount),nextPageToken"
+    assert "fields" not in sent_params[1]
+
+
+def test_fetch_many_threads_regions(monkeypatch):
+    """
+    GIVEN:
+        - `fetch_many` fans regions out over a thread pool.
+    WHEN:
+        - We fetch three regions with a `_CLIENT.get` that echoes the region.
+    THEN:
+        - Results come back keyed by region, in input order, each with its own payload.
+    """
+    def echo_request(*args, params=None, **kwargs):
+        return DummyResponse({"items": [{"snippet": {"title": f"Vid {params['regionCode']}"}}]})
+
+    monkeypatch.setattr("src.fetch._CLIENT.get", echo_request)
+
+    results = fetch_many("dummy_key", ["US", "IN", "CA"], max_results=1)
+
+    assert list(results) == ["US", "IN", "CA"]
+    assert results["CA"]["items"][0]["snippet"]["title"] == "Vid CA"
+
+
+class DummyStreamResponse(DummyResponse):
+    """
+    Stand-in for the context manager returned by `httpx.Client.stream`.
+
+    The body is delivered in small chunks so the test exercises ijson's
+    incremental parsing across chunk boundaries.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self):
+        return self.content
+
+    def iter_bytes(self):
+        body = self.content
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+
+
+def test_iter_trending_videos_streams_items(monkeypatch):
+    """
+    GIVEN:
+        - A response body delivered in 7-byte chunks.
+    WHEN:
+        - We consume `iter_trending_videos`.
+    THEN:
+        - Each element of `items` is yielded as its own dict, in order.
+    """
+    payload = {"items": [
+        {"snippet": {"title": "A"}, "statistics": {"viewCount": "1"}},
+        {"snippet": {"title": "B"}, "statistics": {"viewCount": "2"}},
+    ]}
+    monkeypatch.setattr(
+        "src.fetch._CLIENT.stream", lambda *args, **kwargs: DummyStreamResponse(payload)
+    )
+
+    items = list(iter_trending_videos("dummy_key", region="US", max_results=2))
+
+    assert items == payload["items"]
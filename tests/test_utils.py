@@ -8,12 +8,12 @@ Testing principles on display:
 - Assert both happy paths and failure paths (positive/negative testing).
 """
 
+import csv
 import json
 from pathlib import Path
-import pandas as pd
 import pytest
 
-from src.utils import load_api_key, save_to_json, save_to_csv
+from src.utils import load_api_key, save_to_json, save_to_ndjson, save_to_csv
 
 
 def test_load_api_key_from_custom_env(tmp_path):
@@ -34,7 +34,7 @@ def test_load_api_key_from_custom_env(tmp_path):
     assert key == "TEST_KEY_123"
 
 
-def test_load_api_key_raises_if_missing(tmp_path):
+def test_load_api_key_raises_if_missing(tmp_path, monkeypatch):
     """
     GIVEN a temporary .env file with no key
     WHEN load_api_key is called
@@ -43,15 +43,14 @@ def test_load_api_key_raises_if_missing(tmp_path):
     Why this matters:
     - We want explicit, early failures instead of confusing downstream errors.
     """
-    def test_load_api_key_raises_if_missing(tmp_path, monkeypatch):
-        env_file = tmp_path / ".env"
-        env_file.write_text("", encoding="utf-8")
-        monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("", encoding="utf-8")
+    monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
 
-        with pytest.raises(ValueError) as excinfo:
-            load_api_key(env_file)
+    with pytest.raises(ValueError) as excinfo:
+        load_api_key(str(env_file))
 
-        assert "API key not found" in str(excinfo.value)
+    assert "API key not found" in str(excinfo.value)
 
 
 def test_save_to_json_roundtrip(tmp_path):
@@ -69,6 +68,54 @@ def test_save_to_json_roundtrip(tmp_path):
     assert loaded == data
 
 
+def test_save_to_json_without_orjson(tmp_path, monkeypatch):
+    """
+    GIVEN orjson is not installed (simulated by clearing the module reference)
+    WHEN save_to_json is called
+    THEN the stdlib fallback writes the same data, non-ASCII text included.
+    """
+    monkeypatch.setattr("src.utils.orjson", None)
+    data = {"items": [{"snippet": {"title": "Café"}, "statistics": {"viewCount": "7"}}]}
+    out = tmp_path / "out.json"
+
+    save_to_json(data, filepath=str(out))
+
+    loaded = json.loads(out.read_text(encoding="utf-8"))
+    assert loaded == data
+
+
+def test_save_to_json_pretty_is_indented(tmp_path):
+    """
+    GIVEN pretty=True
+    WHEN save_to_json is called
+    THEN the file is indented (multi-line) but still round-trips; the default is a single line.
+    """
+    data = {"items": [{"snippet": {"title": "A"}}]}
+    compact, pretty = tmp_path / "compact.json", tmp_path / "pretty.json"
+
+    save_to_json(data, filepath=str(compact))
+    save_to_json(data, filepath=str(pretty), pretty=True)
+
+    assert "\n" not in compact.read_text(encoding="utf-8")
+    assert '\n  "items"' in pretty.read_text(encoding="utf-8")
+    assert json.loads(pretty.read_text(encoding="utf-8")) == data
+
+
+def test_save_to_ndjson_one_item_per_line(tmp_path):
+    """
+    GIVEN a response with two items
+    WHEN save_to_ndjson is called
+    THEN each line of the file is one item, in order.
+    """
+    data = {"items": [{"snippet": {"title": "A"}}, {"snippet": {"title": "B"}}]}
+    out = tmp_path / "out.ndjson"
+
+    save_to_ndjson(data, filepath=str(out))
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == data["items"]
+
+
 def test_save_to_csv_structure(tmp_path):
     """
     GIVEN a dict with two items
@@ -87,9 +134,67 @@ def test_save_to_csv_structure(tmp_path):
 
     save_to_csv(data, filepath=str(out))
 
-    df = pd.read_csv(out)
-    assert list(df.columns) == ["title", "views"]
-    assert df.shape == (2, 2)
-    assert df.iloc[0]["title"] == "A"
-    # views may be read as string or number, so we only assert the textual value is present
-    assert str(df.iloc[1]["views"]) in {"9", "9.0"}
+    with open(out, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+
+    assert reader.fieldnames == ["title", "views"]
+    assert len(rows) == 2
+    assert rows[0]["title"] == "A"
+    # csv reads every cell back as text
+    assert rows[1]["views"] == "9"
+
+
+def test_save_to_csv_tolerates_missing_fields(tmp_path):
+    """
+    GIVEN items with a missing snippet and a null statistics block
+    WHEN save_to_csv writes a CSV
+    THEN every item still becomes a row, with empty cells for the missing values.
+    """
+    data = {
+        "items": [
+            {"statistics": {"viewCount": "7"}},
+            {"snippet": {"title": "B"}, "statistics": None},
+        ]
+    }
+    out = tmp_path / "out.csv"
+
+    save_to_csv(data, filepath=str(out))
+
+    with open(out, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert rows == [{"title": "", "views": "7"}, {"title": "B", "views": ""}]
+
+
+def test_save_to_csv_accepts_item_iterable(tmp_path):
+    """
+    GIVEN a generator of items (as produced by fetch.iter_trending_videos)
+    WHEN save_to_csv writes a CSV
+    THEN rows are written straight from the generator.
+    """
+    items = ({"snippet": {"title": t}, "statistics": {"viewCount": "1"}} for t in "AB")
+    out = tmp_path / "out.csv"
+
+    save_to_csv(items, filepath=str(out))
+
+    with open(out, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert [row["title"] for row in rows] == ["A", "B"]
+
+
+def test_save_helpers_log_instead_of_print(tmp_path, caplog, capsys):
+    """
+    GIVEN the save helpers
+    WHEN they write a file
+    THEN they report via the module logger (INFO) and print nothing to stdout.
+    """
+    data = {"items": [{"snippet": {"title": "A"}, "statistics": {"viewCount": "7"}}]}
+    out = tmp_path / "out.csv"
+
+    with caplog.at_level("INFO", logger="src.utils"):
+        save_to_csv(data, filepath=str(out))
+
+    assert f"Saved CSV to {out}" in caplog.messages
+    assert capsys.readouterr().out == ""